@@ -5,68 +5,74 @@ Loads settings from environment variables with sensible defaults.
 """
 
 import os
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+def _env(name: str, default: str):
+    """Field whose default is read from the environment when Config is built."""
+    return field(default_factory=lambda: os.getenv(name, default))
+
+
+def _env_bool(name: str, default: str):
+    """Boolean field parsed from a "true"/"false" environment variable."""
+    return field(default_factory=lambda: os.getenv(name, default).lower() == "true")
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """
     🔧 Central configuration for the MCP Code Assistant.
     All settings can be overridden via environment variables.
+    Immutable once built, so the derived URLs can never go stale.
     """
     
     # ─────────────────────────────────────────────────────────────────────────
     # 🌐 RAG API Settings
     # ─────────────────────────────────────────────────────────────────────────
     
-    RAG_API_BASE_URL: str = os.getenv("RAG_API_BASE_URL", "http://localhost:8900")
-    RAG_CHAT_ENDPOINT: str = os.getenv("RAG_CHAT_ENDPOINT", "/api/chat/rag")
-    UNIVERSAL_RAG_ENDPOINT: str = os.getenv("UNIVERSAL_RAG_ENDPOINT", "/api/chat/universal")
-    
-    
-    @property
-    def rag_chat_url(self) -> str:
-        """Full URL for RAG chat endpoint."""
-        return f"{self.RAG_API_BASE_URL}{self.RAG_CHAT_ENDPOINT}"
-    
-    @property
-    def universal_rag_url(self) -> str:
-        """Full URL for Universal RAG chat endpoint."""
-        return f"{self.RAG_API_BASE_URL}{self.UNIVERSAL_RAG_ENDPOINT}"
+    RAG_API_BASE_URL: str = _env("RAG_API_BASE_URL", "http://localhost:8900")
+    RAG_CHAT_ENDPOINT: str = _env("RAG_CHAT_ENDPOINT", "/api/chat/rag")
+    UNIVERSAL_RAG_ENDPOINT: str = _env("UNIVERSAL_RAG_ENDPOINT", "/api/chat/universal")
     
     # ─────────────────────────────────────────────────────────────────────────
     # ⚙️ General Settings
     # ─────────────────────────────────────────────────────────────────────────
     
-    DEFAULT_SESSION_ID: str = os.getenv("DEFAULT_SESSION_ID", "claude-desktop-session")
-    REQUEST_TIMEOUT: float = float(os.getenv("REQUEST_TIMEOUT", "120"))
-    ENABLE_DOTNET_RAG: bool = os.getenv("ENABLE_DOTNET_RAG", "true").lower() == "true"
-    ENABLE_UNIVERSAL_RAG: bool = os.getenv("ENABLE_UNIVERSAL_RAG", "true").lower() == "true"
+    DEFAULT_SESSION_ID: str = _env("DEFAULT_SESSION_ID", "claude-desktop-session")
+    REQUEST_TIMEOUT: float = field(default_factory=lambda: float(os.getenv("REQUEST_TIMEOUT", "120")))
+    MAX_MESSAGE_CHARS: int = field(default_factory=lambda: int(os.getenv("MAX_MESSAGE_CHARS", "100000")))
+    ENABLE_DOTNET_RAG: bool = _env_bool("ENABLE_DOTNET_RAG", "true")
+    ENABLE_UNIVERSAL_RAG: bool = _env_bool("ENABLE_UNIVERSAL_RAG", "true")
     
     # ─────────────────────────────────────────────────────────────────────────
     # 🔮 Future Agent Endpoints (Add as needed)
     # ─────────────────────────────────────────────────────────────────────────
     
-    SQL_AGENT_ENDPOINT: str = os.getenv("SQL_AGENT_ENDPOINT", "/api/sql/agent")
-    REACT_AGENT_ENDPOINT: str = os.getenv("REACT_AGENT_ENDPOINT", "/api/react/agent")
-    JAVA_AGENT_ENDPOINT: str = os.getenv("JAVA_AGENT_ENDPOINT", "/api/java/agent")
+    SQL_AGENT_ENDPOINT: str = _env("SQL_AGENT_ENDPOINT", "/api/sql/agent")
+    REACT_AGENT_ENDPOINT: str = _env("REACT_AGENT_ENDPOINT", "/api/react/agent")
+    JAVA_AGENT_ENDPOINT: str = _env("JAVA_AGENT_ENDPOINT", "/api/java/agent")
     
-    @property
-    def sql_agent_url(self) -> str:
-        """Full URL for SQL agent endpoint."""
-        return f"{self.RAG_API_BASE_URL}{self.SQL_AGENT_ENDPOINT}"
+    # ─────────────────────────────────────────────────────────────────────────
+    # 🔗 Full Endpoint URLs (built once in __post_init__)
+    # ─────────────────────────────────────────────────────────────────────────
     
-    @property
-    def react_agent_url(self) -> str:
-        """Full URL for React agent endpoint."""
-        return f"{self.RAG_API_BASE_URL}{self.REACT_AGENT_ENDPOINT}"
+    rag_chat_url: str = field(init=False)
+    universal_rag_url: str = field(init=False)
+    sql_agent_url: str = field(init=False)
+    react_agent_url: str = field(init=False)
+    java_agent_url: str = field(init=False)
     
-    @property
-    def java_agent_url(self) -> str:
-        """Full URL for Java agent endpoint."""
-        return f"{self.RAG_API_BASE_URL}{self.JAVA_AGENT_ENDPOINT}"
+    def __post_init__(self) -> None:
+        base = self.RAG_API_BASE_URL
+        object.__setattr__(self, "rag_chat_url", f"{base}{self.RAG_CHAT_ENDPOINT}")
+        object.__setattr__(self, "universal_rag_url", f"{base}{self.UNIVERSAL_RAG_ENDPOINT}")
+        object.__setattr__(self, "sql_agent_url", f"{base}{self.SQL_AGENT_ENDPOINT}")
+        object.__setattr__(self, "react_agent_url", f"{base}{self.REACT_AGENT_ENDPOINT}")
+        object.__setattr__(self, "java_agent_url", f"{base}{self.JAVA_AGENT_ENDPOINT}")
 
 
 # Global config instance
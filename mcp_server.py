@@ -13,11 +13,12 @@
 import asyncio
 import sys
 import logging
-from typing import Any
+import textwrap
+from typing import Any, Awaitable, Callable
 
 import httpx
+import orjson
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
 from mcp.types import (
     Tool,
     TextContent,
@@ -45,115 +46,123 @@ logger = logging.getLogger("noor-mcp")
 
 server = Server("noor-code-assistant")
 
+# Shared HTTP client (created in main(), reused across tool calls for keep-alive
+# and HTTP/2 multiplexing of concurrent requests)
+_http_client: httpx.AsyncClient | None = None
+
 
 # ============================================================================
 # 📋 Tool Definitions
 # ============================================================================
 
+# Tool descriptions (dedented and stripped once at import)
+_DOTNET_DESC = textwrap.dedent("""
+    Intelligent Code Assistant powered by RAG (Retrieval-Augmented Generation).
+
+    Use this tool when you need to:
+    - Generate C#/.NET code based on existing codebase patterns
+    - Query information about project architecture and structure
+    - Get code snippets that follow the project's conventions
+    - Find existing methods, DTOs, services, or interfaces
+    - Generate SQL queries for the project's database schema
+    - Understand how specific features are implemented
+
+    The tool has access to complete codebase context including:
+    - ASP.NET Core 8 APIs and Controllers
+    - PostgreSQL/SQL Server database schemas
+    - Service interfaces and implementations
+    - DTOs, Entities, and ViewModels
+    - Repository patterns and data access layers
+    - Clean Architecture project structures
+
+    Returns detailed code examples with comprehensive explanations.
+""").strip()
+
+_UNIVERSAL_DESC = textwrap.dedent("""
+    Universal Code Assistant powered by RAG for ANY programming language.
+
+    Use this tool when you need to:
+    - Query any non-.NET codebase (Python, Java, React, Go, Rust, PHP, Ruby, C++, Flutter)
+    - Understand project architecture and patterns for any language
+    - Find existing functions, classes, components, or modules
+    - Generate code following the project's conventions
+    - Get code snippets with explanations
+
+    The language/framework is configured on the server side via config.yaml.
+""").strip()
+
+_ALL_TOOLS = [
+    Tool(
+        name="code_assistant",
+        description=_DOTNET_DESC,
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": (
+                        "Your code-related question or request. Be specific about what you need. "
+                        "Examples: 'Create a C# function to get employee requests by ID', "
+                        "'Show me how pagination is implemented in this project', "
+                        "'Generate a DTO for the Employee table'"
+                    )
+                },
+                "session_id": {
+                    "type": "string",
+                    "description": (
+                        "Optional session ID for conversation continuity. "
+                        "Use the same session_id to maintain context across multiple questions."
+                    ),
+                    "default": config.DEFAULT_SESSION_ID
+                }
+            },
+            "required": ["message"]
+        }
+    ),
+    Tool(
+        name="universal_code_assistant",
+        description=_UNIVERSAL_DESC,
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": (
+                        "Your code-related question or request. Be specific about what you need. "
+                        "Examples: 'How is authentication implemented?', "
+                        "'Show me the main API routes', "
+                        "'How is state management done in this project?'"
+                    )
+                },
+                "session_id": {
+                    "type": "string",
+                    "description": (
+                        "Optional session ID for conversation continuity. "
+                        "Use the same session_id to maintain context across multiple questions."
+                    ),
+                    "default": config.DEFAULT_SESSION_ID
+                }
+            },
+            "required": ["message"]
+        }
+    ),
+]
+
+# Filter based on config flags (once; flags are fixed at startup)
+_TOOL_ENABLED = {
+    "code_assistant": config.ENABLE_DOTNET_RAG,
+    "universal_code_assistant": config.ENABLE_UNIVERSAL_RAG,
+}
+_ENABLED_TOOLS: list[Tool] = [tool for tool in _ALL_TOOLS if _TOOL_ENABLED.get(tool.name, True)]
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """
     Define all available tools for Claude Desktop.
     Each tool maps to an API endpoint in the RAG system.
     """
-    tools = [
-        Tool(
-            name="code_assistant",
-            description="""
-            Intelligent Code Assistant powered by RAG (Retrieval-Augmented Generation).
-
-            Use this tool when you need to:
-            - Generate C#/.NET code based on existing codebase patterns
-            - Query information about project architecture and structure
-            - Get code snippets that follow the project's conventions
-            - Find existing methods, DTOs, services, or interfaces
-            - Generate SQL queries for the project's database schema
-            - Understand how specific features are implemented
-
-            The tool has access to complete codebase context including:
-            - ASP.NET Core 8 APIs and Controllers
-            - PostgreSQL/SQL Server database schemas
-            - Service interfaces and implementations
-            - DTOs, Entities, and ViewModels
-            - Repository patterns and data access layers
-            - Clean Architecture project structures
-
-            Returns detailed code examples with comprehensive explanations.
-            """.strip(),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": (
-                            "Your code-related question or request. Be specific about what you need. "
-                            "Examples: 'Create a C# function to get employee requests by ID', "
-                            "'Show me how pagination is implemented in this project', "
-                            "'Generate a DTO for the Employee table'"
-                        )
-                    },
-                    "session_id": {
-                        "type": "string",
-                        "description": (
-                            "Optional session ID for conversation continuity. "
-                            "Use the same session_id to maintain context across multiple questions."
-                        ),
-                        "default": config.DEFAULT_SESSION_ID
-                    }
-                },
-                "required": ["message"]
-            }
-        ),
-        Tool(
-            name="universal_code_assistant",
-            description="""
-            Universal Code Assistant powered by RAG for ANY programming language.
-
-            Use this tool when you need to:
-            - Query any non-.NET codebase (Python, Java, React, Go, Rust, PHP, Ruby, C++, Flutter)
-            - Understand project architecture and patterns for any language
-            - Find existing functions, classes, components, or modules
-            - Generate code following the project's conventions
-            - Get code snippets with explanations
-
-            The language/framework is configured on the server side via config.yaml.
-            """.strip(),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": (
-                            "Your code-related question or request. Be specific about what you need. "
-                            "Examples: 'How is authentication implemented?', "
-                            "'Show me the main API routes', "
-                            "'How is state management done in this project?'"
-                        )
-                    },
-                    "session_id": {
-                        "type": "string",
-                        "description": (
-                            "Optional session ID for conversation continuity. "
-                            "Use the same session_id to maintain context across multiple questions."
-                        ),
-                        "default": config.DEFAULT_SESSION_ID
-                    }
-                },
-                "required": ["message"]
-            }
-        ),
-    ]
-    
-    # Filter based on config flags
-    filtered_tools = []
-    for tool in tools:
-        if tool.name == "code_assistant" and not config.ENABLE_DOTNET_RAG:
-            continue
-        if tool.name == "universal_code_assistant" and not config.ENABLE_UNIVERSAL_RAG:
-            continue
-        filtered_tools.append(tool)
-    
-    return filtered_tools
+    return _ENABLED_TOOLS
 
 
 # ============================================================================
@@ -167,21 +176,15 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
     Routes to appropriate handler based on tool name.
     """
     
-    logger.info(f"Tool called: {name}")  # This goes to stderr, safe!
+    logger.info("Tool called: %s", name)  # This goes to stderr, safe!
     
-    handlers = {}
-    if config.ENABLE_DOTNET_RAG:
-        handlers["code_assistant"] = handle_code_assistant
-    if config.ENABLE_UNIVERSAL_RAG:
-        handlers["universal_code_assistant"] = handle_universal_code_assistant
-    
-    handler = handlers.get(name)
+    handler = _HANDLERS.get(name)
     
     if handler is None:
         return CallToolResult(
             content=[TextContent(
                 type="text",
-                text=f"Unknown tool: '{name}'. Available tools: {', '.join(handlers.keys())}"
+                text=f"Unknown tool: '{name}'. Available tools: {_AVAILABLE_TOOL_NAMES}"
             )],
             isError=True
         )
@@ -189,7 +192,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
     try:
         return await handler(arguments)
     except Exception as e:
-        logger.error(f"Error executing tool '{name}': {str(e)}")
+        logger.error("Error executing tool '%s': %s", name, e)
         return CallToolResult(
             content=[TextContent(
                 type="text",
@@ -203,22 +206,89 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
 # 🔧 Tool Handlers
 # ============================================================================
 
-async def handle_code_assistant(arguments: dict[str, Any]) -> CallToolResult:
+def _connect_error_text(api_name: str, url: str) -> str:
+    """Message shown when the RAG server cannot be reached."""
+    return (
+        f"Connection Error: Cannot reach {api_name} at {url}\n\n"
+        f"Please ensure your Python RAG server is running:\n"
+        f"cd /path/to/your/rag-project\n"
+        f"source env_container/bin/activate\n"
+        f"uvicorn main:app --reload --port 8900"
+    )
+
+
+def _timeout_error_text(api_name: str) -> str:
+    """Message shown when the RAG server exceeds REQUEST_TIMEOUT."""
+    return (
+        f"Request Timeout: The {api_name} did not respond within {config.REQUEST_TIMEOUT} seconds.\n\n"
+        f"Try simplifying your question or increasing REQUEST_TIMEOUT in .env"
+    )
+
+
+# Error texts only depend on startup config, so build them once
+_RAG_CONNECT_ERR = _connect_error_text("RAG API", config.rag_chat_url)
+_RAG_TIMEOUT_ERR = _timeout_error_text("RAG API")
+_UNIVERSAL_CONNECT_ERR = _connect_error_text("Universal RAG API", config.universal_rag_url)
+_UNIVERSAL_TIMEOUT_ERR = _timeout_error_text("Universal RAG API")
+
+# Validation errors are fixed, so one shared result per tool is enough
+_EMPTY_MSG_ERR_DOTNET = CallToolResult(
+    content=[TextContent(
+        type="text",
+        text="Please provide a message/question for the code assistant."
+    )],
+    isError=True
+)
+_EMPTY_MSG_ERR_UNIVERSAL = CallToolResult(
+    content=[TextContent(
+        type="text",
+        text="Please provide a message/question for the universal code assistant."
+    )],
+    isError=True
+)
+_OVERSIZE_MSG_ERR = CallToolResult(
+    content=[TextContent(
+        type="text",
+        text=(
+            f"Message too long: the limit is {config.MAX_MESSAGE_CHARS} characters.\n\n"
+            f"Shorten your question or increase MAX_MESSAGE_CHARS in .env"
+        )
+    )],
+    isError=True
+)
+
+
+def _clean(s: str) -> str:
+    """Strip surrounding whitespace, skipping the copy when there is none."""
+    return s.strip() if s and (s[0].isspace() or s[-1].isspace()) else s
+
+
+async def _call_rag(
+    url: str,
+    arguments: dict[str, Any],
+    *,
+    api_name: str,
+    assistant_name: str,
+    has_sql_block: bool,
+    has_language: bool,
+    connect_err: str,
+    timeout_err: str,
+    empty_msg_err: CallToolResult,
+) -> CallToolResult:
     """
-    Handle .NET code assistant requests by calling the RAG API.
+    Shared request/response flow for the RAG-backed tools.
+    `has_sql_block` adds the SQL/markdown sections (.NET API), `has_language`
+    names the codebase language in the footer (Universal API).
     """
-    message = arguments.get("message", "").strip()
+    message = _clean(arguments.get("message", ""))
     session_id = arguments.get("session_id", config.DEFAULT_SESSION_ID)
     
     # Validate input
     if not message:
-        return CallToolResult(
-            content=[TextContent(
-                type="text",
-                text="Please provide a message/question for the code assistant."
-            )],
-            isError=True
-        )
+        return empty_msg_err
+    if len(message) > config.MAX_MESSAGE_CHARS:
+        logger.error("Message rejected: %s chars exceeds MAX_MESSAGE_CHARS", len(message))
+        return _OVERSIZE_MSG_ERR
     
     # Prepare request payload
     payload = {
@@ -226,59 +296,73 @@ async def handle_code_assistant(arguments: dict[str, Any]) -> CallToolResult:
         "message": message
     }
     
-    logger.info(f"Calling RAG API: {config.rag_chat_url}")
+    logger.info("Calling %s: %s", api_name, url)
     
     try:
-        async with httpx.AsyncClient(timeout=config.REQUEST_TIMEOUT) as client:
-            response = await client.post(
-                config.rag_chat_url,
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            data = response.json()
+        # Content-Type: application/json is a default header on the shared client
+        response = await _http_client.post(url, content=orjson.dumps(payload))
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
-        logger.info(f"RAG API response received, ok={data.get('ok')}")
+        logger.info("%s response received, ok=%s", api_name, data.get("ok"))
         
         if not data.get("ok", False):
-            error_msg = data.get("error") or data.get("message") or "Unknown error from RAG API"
+            error_msg = data.get("error") or data.get("message") or f"Unknown error from {api_name}"
             return CallToolResult(
                 content=[TextContent(
                     type="text",
-                    text=f"RAG API Error: {error_msg}"
+                    text=f"{api_name} Error: {error_msg}"
                 )],
                 isError=True
             )
         
-        # Build response content
-        result_parts = []
-        
-        # Main answer
-        if data.get("answer"):
-            result_parts.append(data["answer"])
-        
-        # SQL if present
-        if data.get("sql"):
-            result_parts.append(f"\n\n### Generated SQL\n```sql\n{data['sql']}\n```")
-        
-        # Markdown content if present
-        if data.get("markdown"):
-            result_parts.append(f"\n\n{data['markdown']}")
-        
-        # Clarification needed
-        if data.get("needs_clarification"):
-            result_parts.append(
-                f"\n\n**Clarification Needed:** {data['needs_clarification']}"
-            )
+        # Read each response field once
+        answer = data.get("answer")
+        sql = data.get("sql")
+        markdown = data.get("markdown")
+        clarification = data.get("needs_clarification")
+        chunks_count = data.get("chunks_count", 0)
+        has_extras = clarification or (has_sql_block and (sql or markdown))
         
         # Metadata footer
-        chunks_count = data.get("chunks_count", 0)
+        footer = None
         if chunks_count > 0:
-            result_parts.append(
-                f"\n\n---\n*Context: {chunks_count} code chunks analyzed from your codebase*"
-            )
+            if has_language:
+                language = data.get("language", "unknown")
+                footer = f"\n\n---\n*Context: {chunks_count} code chunks analyzed ({language} codebase)*"
+            else:
+                footer = f"\n\n---\n*Context: {chunks_count} code chunks analyzed from your codebase*"
         
-        final_response = "\n".join(result_parts) if result_parts else "No response from code assistant."
+        if answer and not has_extras:
+            # Fast path: answer (+ footer) only, same layout as the join below
+            final_response = f"{answer}\n{footer}" if footer else answer
+        else:
+            # Build response content
+            result_parts = []
+            
+            # Main answer
+            if answer:
+                result_parts.append(answer)
+            
+            if has_sql_block:
+                # SQL if present
+                if sql:
+                    result_parts.append(f"\n\n### Generated SQL\n```sql\n{sql}\n```")
+                
+                # Markdown content if present
+                if markdown:
+                    result_parts.append(f"\n\n{markdown}")
+            
+            # Clarification needed
+            if clarification:
+                result_parts.append(
+                    f"\n\n**Clarification Needed:** {clarification}"
+                )
+            
+            if footer:
+                result_parts.append(footer)
+            
+            final_response = "\n".join(result_parts) if result_parts else f"No response from {assistant_name}."
         
         return CallToolResult(
             content=[TextContent(
@@ -287,47 +371,24 @@ async def handle_code_assistant(arguments: dict[str, Any]) -> CallToolResult:
             )]
         )
     
-    except httpx.ConnectError:
-        logger.error(f"Connection error to {config.rag_chat_url}")
-        return CallToolResult(
-            content=[TextContent(
-                type="text",
-                text=(
-                    f"Connection Error: Cannot reach RAG API at {config.rag_chat_url}\n\n"
-                    f"Please ensure your Python RAG server is running:\n"
-                    f"cd /path/to/your/rag-project\n"
-                    f"source env_container/bin/activate\n"
-                    f"uvicorn main:app --reload --port 8900"
-                )
-            )],
-            isError=True
-        )
-    
-    except httpx.TimeoutException:
-        logger.error(f"Timeout after {config.REQUEST_TIMEOUT}s")
-        return CallToolResult(
-            content=[TextContent(
-                type="text",
-                text=(
-                    f"Request Timeout: The RAG API did not respond within {config.REQUEST_TIMEOUT} seconds.\n\n"
-                    f"Try simplifying your question or increasing REQUEST_TIMEOUT in .env"
-                )
-            )],
-            isError=True
-        )
-    
-    except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error: {e.response.status_code}")
+    except (httpx.ConnectError, httpx.TimeoutException, httpx.HTTPStatusError) as e:
+        # One handler for the expected httpx failures, dispatched by kind
+        if isinstance(e, httpx.ConnectError):
+            logger.error("Connection error to %s", url)
+            text = connect_err
+        elif isinstance(e, httpx.TimeoutException):
+            logger.error("Timeout after %ss", config.REQUEST_TIMEOUT)
+            text = timeout_err
+        else:
+            logger.error("HTTP error: %s", e.response.status_code)
+            text = f"HTTP Error {e.response.status_code}: {e.response.text}"
         return CallToolResult(
-            content=[TextContent(
-                type="text",
-                text=f"HTTP Error {e.response.status_code}: {e.response.text}"
-            )],
+            content=[TextContent(type="text", text=text)],
             isError=True
         )
     
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         return CallToolResult(
             content=[TextContent(
                 type="text",
@@ -337,125 +398,91 @@ async def handle_code_assistant(arguments: dict[str, Any]) -> CallToolResult:
         )
 
 
+async def handle_code_assistant(arguments: dict[str, Any]) -> CallToolResult:
+    """
+    Handle .NET code assistant requests by calling the RAG API.
+    """
+    return await _call_rag(
+        config.rag_chat_url, arguments,
+        api_name="RAG API", assistant_name="code assistant",
+        has_sql_block=True, has_language=False,
+        connect_err=_RAG_CONNECT_ERR, timeout_err=_RAG_TIMEOUT_ERR,
+        empty_msg_err=_EMPTY_MSG_ERR_DOTNET
+    )
+
+
 async def handle_universal_code_assistant(arguments: dict[str, Any]) -> CallToolResult:
     """
     Handle universal code assistant requests by calling the Universal RAG API.
     """
-    message = arguments.get("message", "").strip()
-    session_id = arguments.get("session_id", config.DEFAULT_SESSION_ID)
-    
-    if not message:
-        return CallToolResult(
-            content=[TextContent(
-                type="text",
-                text="Please provide a message/question for the universal code assistant."
-            )],
-            isError=True
-        )
-    
-    payload = {
-        "session_id": session_id,
-        "message": message
-    }
-    
-    logger.info(f"Calling Universal RAG API: {config.universal_rag_url}")
-    
-    try:
-        async with httpx.AsyncClient(timeout=config.REQUEST_TIMEOUT) as client:
-            response = await client.post(
-                config.universal_rag_url,
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            data = response.json()
-        
-        logger.info(f"Universal RAG API response received, ok={data.get('ok')}")
-        
-        if not data.get("ok", False):
-            error_msg = data.get("error") or data.get("message") or "Unknown error from Universal RAG API"
-            return CallToolResult(
-                content=[TextContent(type="text", text=f"Universal RAG API Error: {error_msg}")],
-                isError=True
-            )
-        
-        result_parts = []
-        
-        if data.get("answer"):
-            result_parts.append(data["answer"])
-        
-        if data.get("needs_clarification"):
-            result_parts.append(f"\n\n**Clarification Needed:** {data['needs_clarification']}")
-        
-        # Metadata footer
-        chunks_count = data.get("chunks_count", 0)
-        language = data.get("language", "unknown")
-        if chunks_count > 0:
-            result_parts.append(
-                f"\n\n---\n*Context: {chunks_count} code chunks analyzed ({language} codebase)*"
-            )
-        
-        final_response = "\n".join(result_parts) if result_parts else "No response from universal code assistant."
-        
-        return CallToolResult(
-            content=[TextContent(type="text", text=final_response)]
-        )
-    
-    except httpx.ConnectError:
-        logger.error(f"Connection error to {config.universal_rag_url}")
-        return CallToolResult(
-            content=[TextContent(
-                type="text",
-                text=(
-                    f"Connection Error: Cannot reach Universal RAG API at {config.universal_rag_url}\n\n"
-                    f"Please ensure your Python RAG server is running:\n"
-                    f"uvicorn main:app --reload --port 8900"
-                )
-            )],
-            isError=True
-        )
-    
-    except httpx.TimeoutException:
-        return CallToolResult(
-            content=[TextContent(
-                type="text",
-                text=f"Request Timeout: The Universal RAG API did not respond within {config.REQUEST_TIMEOUT} seconds."
-            )],
-            isError=True
-        )
-    
-    except httpx.HTTPStatusError as e:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"HTTP Error {e.response.status_code}: {e.response.text}")],
-            isError=True
-        )
-    
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Unexpected Error: {type(e).__name__}: {str(e)}")],
-            isError=True
-        )
+    return await _call_rag(
+        config.universal_rag_url, arguments,
+        api_name="Universal RAG API", assistant_name="universal code assistant",
+        has_sql_block=False, has_language=True,
+        connect_err=_UNIVERSAL_CONNECT_ERR, timeout_err=_UNIVERSAL_TIMEOUT_ERR,
+        empty_msg_err=_EMPTY_MSG_ERR_UNIVERSAL
+    )
+
+
+# Dispatch table (built once; enable flags are fixed at startup)
+_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[CallToolResult]]] = {}
+if config.ENABLE_DOTNET_RAG:
+    _HANDLERS["code_assistant"] = handle_code_assistant
+if config.ENABLE_UNIVERSAL_RAG:
+    _HANDLERS["universal_code_assistant"] = handle_universal_code_assistant
+
+_AVAILABLE_TOOL_NAMES = ", ".join(_HANDLERS)
 
 
 # ============================================================================
 # 🚀 Main Entry Point
 # ============================================================================
 
+async def _warm_up_connection() -> None:
+    """Open a pooled connection to the RAG server ahead of the first tool call."""
+    try:
+        await _http_client.head(config.RAG_API_BASE_URL)
+        logger.info("RAG API connection warmed up")
+    except Exception as e:
+        # Best effort only; the first real call will report any problem
+        logger.info("RAG API warm-up skipped: %s", e)
+
+
 async def main():
     """Start the MCP server using stdio transport."""
     logger.info("Starting Noor MCP Code Assistant Server...")
-    logger.info(f"RAG API URL (.NET): {config.rag_chat_url} ({'✅ Enabled' if config.ENABLE_DOTNET_RAG else '❌ Disabled'})")
-    logger.info(f"RAG API URL (Universal): {config.universal_rag_url} ({'✅ Enabled' if config.ENABLE_UNIVERSAL_RAG else '❌ Disabled'})")
-    logger.info(f"Request Timeout: {config.REQUEST_TIMEOUT}s")
+    logger.info("RAG API URL (.NET): %s (%s)", config.rag_chat_url, "✅ Enabled" if config.ENABLE_DOTNET_RAG else "❌ Disabled")
+    logger.info("RAG API URL (Universal): %s (%s)", config.universal_rag_url, "✅ Enabled" if config.ENABLE_UNIVERSAL_RAG else "❌ Disabled")
+    logger.info("Request Timeout: %ss", config.REQUEST_TIMEOUT)
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    global _http_client
+    
+    # Only needed once the server actually starts serving
+    from mcp.server.stdio import stdio_server
+    
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=config.REQUEST_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        headers={"Content-Type": "application/json"}
+    ) as _http_client:
+        # Handshake with the RAG server while stdio is being set up
+        warm_up = asyncio.create_task(_warm_up_connection())
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(
+                    read_stream,
+                    write_stream,
+                    server.create_initialization_options()
+                )
+        finally:
+            warm_up.cancel()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:  # Windows, or uvloop not installed
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file